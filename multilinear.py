@@ -1,4 +1,307 @@
-import collections.abc
+# Compact component storage for elements of small-modulus systems
+from array import array as _array
+
+# Optional numpy support for the batch (structure-of-arrays) operations on
+# the system classes; the element classes never need it. cupy is accepted as
+# a drop-in alternative: when the caller passes cupy arrays, the same batch
+# expressions run as GPU kernels and the data never leaves the device.
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+try:
+    import cupy as _cp
+except ImportError:
+    _cp = None
+
+
+# Pick the array module matching x, so batch results stay on whichever
+# device (host numpy or GPU cupy) the inputs live on
+def _array_module(x):
+    if _cp is not None and isinstance(x, _cp.ndarray):
+        return _cp
+    if _np is None:
+        raise ImportError("numpy is required for batch operations.")
+    return _np
+
+# Optional compiled-kernel support. numba is not a dependency of this
+# project: when it is missing, or when the modulus is too large for 64-bit
+# arithmetic, the pure Python formulas below are used unchanged.
+try:
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
+# Optional native exponentiation loops (multilinear_ext.cpp, built by hand
+# with pybind11); picked up automatically when importable.
+try:
+    import multilinear_ext as _ext
+except ImportError:
+    _ext = None
+
+# The extension's __int128 intermediates are safe for any modulus that fits
+# a signed 64-bit word
+_EXT_MAX_MODULUS = (1 << 63) - 1
+
+# Largest modulus for which the int64 kernels are safe. Every product in the
+# kernels is taken between two operands already reduced mod N and is itself
+# reduced immediately, so intermediates stay below N**2 and the final sums of
+# reduced terms stay far below 2**63 whenever N <= 2**31.
+_KERNEL_MAX_MODULUS = 1 << 31
+
+# Largest modulus whose reduced components (always below N) are guaranteed
+# to fit the signed 64-bit slots of an array('q'). Elements of such systems
+# store their components in one compact C buffer instead of a list of boxed
+# ints — roughly a third of the memory, and better cache locality when many
+# elements sit in a container. Larger moduli keep the plain list.
+_COMPACT_MAX_MODULUS = 1 << 63
+
+
+# int64 version of the M3 multiply formula (see M3Element.__mul__). Each
+# product is reduced as soon as it is formed so all intermediates fit in a
+# signed 64-bit word; `x * y % N * z % N` parses as `((x*y) % N * z) % N`.
+def _m3_mul_kernel(a0, a1, a2, b0, b1, b2, A, B, C, D, E, N):
+    r0 = (a0 + b0 + a0 * b0 % N + A * a1 % N * b1 % N
+          + C * a2 % N * b1 % N + B * a2 % N * b2 % N) % N
+    r1 = (a1 + b1 + a1 * b0 % N + a0 * b1 % N
+          + D * a1 % N * b1 % N + E * a1 % N * b2 % N) % N
+    r2 = (a2 + b2 + a2 * b0 % N + a0 * b2 % N
+          + D * a2 % N * b1 % N + E * a2 % N * b2 % N) % N
+    return r0, r1, r2
+
+
+# int64 version of the M4 multiply formula (see M4Element.__mul__)
+def _m4_mul_kernel(a0, a1, a2, a3, b0, b1, b2, b3, A, B, C, D, E, F, G, H, I, N):
+    r0 = (a0 + b0 + a0 * b0 % N + A * a1 % N * b1 % N + E * a3 % N * b1 % N
+          + B * a2 % N * b2 % N + D * a1 % N * b2 % N + F * a3 % N * b2 % N
+          + C * a3 % N * b3 % N) % N
+    r1 = (a1 + b1 + a1 * b0 % N + a0 * b1 % N + G * a1 % N * b1 % N
+          + H * a1 % N * b2 % N + I * a1 % N * b3 % N) % N
+    r2 = (a2 + b2 + a2 * b0 % N + a0 * b2 % N + G * a2 % N * b1 % N
+          + H * a2 % N * b2 % N + I * a2 % N * b3 % N) % N
+    r3 = (a3 + b3 + a3 * b0 % N + a0 * b3 % N + G * a3 % N * b1 % N
+          + H * a3 % N * b2 % N + I * a3 % N * b3 % N) % N
+    return r0, r1, r2, r3
+
+
+# int64 version of the M3 squaring formula (see M3Element._sqr)
+def _m3_sqr_kernel(a0, a1, a2, A, B, C, D, E, N):
+    r0 = (2 * a0 + a0 * a0 % N + A * a1 % N * a1 % N
+          + C * a2 % N * a1 % N + B * a2 % N * a2 % N) % N
+    r1 = (2 * a1 + 2 * (a0 * a1 % N)
+          + D * a1 % N * a1 % N + E * a1 % N * a2 % N) % N
+    r2 = (2 * a2 + 2 * (a0 * a2 % N)
+          + D * a2 % N * a1 % N + E * a2 % N * a2 % N) % N
+    return r0, r1, r2
+
+
+# int64 version of the M4 squaring formula (see M4Element._sqr)
+def _m4_sqr_kernel(a0, a1, a2, a3, A, B, C, D, E, F, G, H, I, N):
+    r0 = (2 * a0 + a0 * a0 % N + A * a1 % N * a1 % N + E * a3 % N * a1 % N
+          + B * a2 % N * a2 % N + D * a1 % N * a2 % N + F * a3 % N * a2 % N
+          + C * a3 % N * a3 % N) % N
+    r1 = (2 * a1 + 2 * (a0 * a1 % N) + G * a1 % N * a1 % N
+          + H * a1 % N * a2 % N + I * a1 % N * a3 % N) % N
+    r2 = (2 * a2 + 2 * (a0 * a2 % N) + G * a2 % N * a1 % N
+          + H * a2 % N * a2 % N + I * a2 % N * a3 % N) % N
+    r3 = (2 * a3 + 2 * (a0 * a3 % N) + G * a3 % N * a1 % N
+          + H * a3 % N * a2 % N + I * a3 % N * a3 % N) % N
+    return r0, r1, r2, r3
+
+
+if _njit is not None:
+    _m3_mul_kernel = _njit(cache=True)(_m3_mul_kernel)
+    _m4_mul_kernel = _njit(cache=True)(_m4_mul_kernel)
+    _m3_sqr_kernel = _njit(cache=True)(_m3_sqr_kernel)
+    _m4_sqr_kernel = _njit(cache=True)(_m4_sqr_kernel)
+
+# Exponents at least this many bits wide are worth the table setup cost of
+# windowed exponentiation in __pow__
+_WINDOW_MIN_BITS = 64
+
+# Moduli narrower than this reduce faster through CPython's built-in '%'
+# (a single C-level division) than through any Python-level scheme; the
+# shift-and-fold reducer below only overtakes it from a few hundred bits up
+_FOLD_MIN_BITS = 192
+
+# For power-of-two moduli the bit-mask reducer overtakes '%' once the
+# unreduced products outgrow a couple of machine words
+_POW2_MIN_BITS = 30
+
+
+# Build a fast reduction callable for moduli of special binary shape, or
+# None when plain '%' is the better option. Two shapes are recognized:
+#
+# * powers of two (Z/2^k Z): reduction is a plain bit-mask, done via the
+#   bound __and__ of the mask — a single C call with no division;
+# * 2**k - c with small c (Mersenne and pseudo-Mersenne primes, the natural
+#   choices for the crypto constructions in the article): 2**k = c (mod N),
+#   so the high bits of x can be folded down with a shift, a mask and one
+#   small multiply instead of a full bignum division. Only valid for
+#   non-negative x.
+def _special_form_reducer(modulus):
+    k = modulus.bit_length()
+    if modulus & (modulus - 1) == 0:
+        if k >= _POW2_MIN_BITS:
+            return (modulus - 1).__and__
+        return None
+    if k < _FOLD_MIN_BITS:
+        return None
+    c = (1 << k) - modulus
+    if c.bit_length() > k // 2:
+        return None
+    mask = (1 << k) - 1
+
+    def red(x, modulus=modulus, mask=mask, c=c, k=k):
+        while x > mask:
+            x = (x & mask) + c * (x >> k)
+        return x - modulus if x >= modulus else x
+
+    return red
+
+
+# Lane layout for the packed additive fast path: the 3 (or 4) components of
+# an element live side by side in one Python integer, 64 bits per lane. A
+# single bigint addition then adds every component at once, and partial sums
+# can accumulate carry-free until a lane approaches 64 bits.
+_LANE_BITS = 64
+_LANE_MASK = (1 << _LANE_BITS) - 1
+
+
+# Reduce every lane of a packed accumulator mod N
+def _reduce_packed(packed, modulus, lanes):
+    out = 0
+    for i in range(lanes):
+        shift = _LANE_BITS * i
+        out |= ((packed >> shift) & _LANE_MASK) % modulus << shift
+    return out
+
+
+# Montgomery-form modular arithmetic for odd moduli: residues are kept as
+# x*R mod N with R = 2**k >= N, so that reduction after a multiply needs two
+# multiplies, a mask and a shift (REDC) instead of a division by N.
+#
+# This is provided as an opt-in utility for experiments and for compiled
+# backends, where the division it avoids is the dominant cost. It is not
+# used by the element classes: at Python level REDC only draws level with
+# CPython's '%' around 2048-bit moduli, and the multilinear product formulas
+# would additionally need one REDC per product term plus residue conversion
+# at every user-facing boundary. Special-form moduli are served far better
+# by _special_form_reducer above.
+class Montgomery:
+    def __init__(self, modulus):
+        if modulus % 2 == 0 or modulus <= 1:
+            raise ValueError("Montgomery reduction requires an odd modulus > 1.")
+        self.modulus = modulus
+        self.shift = modulus.bit_length()
+        self.mask = (1 << self.shift) - 1           # R - 1
+        self.n_inv = pow(-modulus, -1, self.mask + 1)   # -N^-1 mod R
+        self.r2 = (1 << (2 * self.shift)) % modulus     # R^2 mod N, for to_mont
+
+    # Montgomery reduction: for x < R*N returns x * R^-1 mod N
+    def redc(self, x):
+        m = ((x & self.mask) * self.n_inv) & self.mask
+        u = (x + m * self.modulus) >> self.shift
+        return u - self.modulus if u >= self.modulus else u
+
+    # Convert a plain residue into Montgomery form (x -> x*R mod N)
+    def to_mont(self, x):
+        return self.redc((x % self.modulus) * self.r2)
+
+    # Convert a Montgomery-form residue back to a plain one
+    def from_mont(self, x):
+        return self.redc(x)
+
+    # Multiply two Montgomery-form residues, staying in Montgomery form
+    def mul(self, x, y):
+        return self.redc(x * y)
+
+    def __repr__(self):
+        return f"Montgomery(modulus={self.modulus})"
+
+
+# Sliding-window exponentiation with a 4-bit window, shared by M3Element and
+# M4Element (it only needs '_sqr' and '*'). Precomputes the odd powers
+# base^1, base^3, ..., base^15 (8 multiplies), then scans the exponent
+# MSB-first consuming up to 4 bits per window, which cuts the number of
+# multiplies from ~bits/2 to ~bits/5 for long exponents. Like __pow__ itself,
+# the reassociation relies on the power associativity of the operation.
+def _pow_window(base, exponent):
+    # Bind the two hot methods to locals once: each loop iteration then pays
+    # a plain call instead of an attribute lookup through the type
+    cls = type(base)
+    sqr = cls._sqr
+    mul = cls.__mul__
+
+    sq = sqr(base)
+    table = [base]                      # table[i] holds base^(2i+1)
+    for _ in range(7):
+        table.append(mul(table[-1], sq))
+
+    result = None                       # None stands for the identity
+    i = exponent.bit_length() - 1
+    while i >= 0:
+        if not (exponent >> i) & 1:
+            result = sqr(result)
+            i -= 1
+            continue
+        # Greedily take a window of up to 4 bits ending in a set bit, so the
+        # window value u is odd and base^u sits in the table
+        s = i - 3 if i >= 3 else 0
+        while not (exponent >> s) & 1:
+            s += 1
+        u = (exponent >> s) & ((1 << (i - s + 1)) - 1)
+        if result is None:
+            result = table[u >> 1]
+        else:
+            for _ in range(i - s + 1):
+                result = sqr(result)
+            result = mul(result, table[u >> 1])
+        i = s - 1
+
+    return result
+
+
+# Cache of functions built by compile_pow, keyed by exponent. The generated
+# code only uses the element's own '_sqr' and '*', so one function serves
+# every system and both element classes.
+_COMPILED_POW = {}
+
+
+# Build (and cache) a function computing a -> a^exponent for that one fixed
+# exponent. The square-and-multiply loop is unrolled into straight-line
+# statements and compiled once with exec, so repeated calls pay neither the
+# loop bookkeeping nor the per-bit tests of __pow__. Worth it when the same
+# exponent is applied many times (a fixed order in key derivation, say);
+# for one-off exponents plain '**' is the better choice.
+def compile_pow(exponent):
+    if not isinstance(exponent, int) or exponent < 0:
+        raise ValueError("Exponent must be a non-negative integer.")
+    try:
+        return _COMPILED_POW[exponent]
+    except KeyError:
+        pass
+
+    if exponent == 0:
+        def _pow_fixed(a):
+            return a.system.identity()
+    else:
+        # MSB-first over the bits after the leading one, exactly as in
+        # __pow__, with the squarings going through the cheaper '_sqr'
+        lines = ["def _pow_fixed(a):", "    t = a"]
+        for bit in bin(exponent)[3:]:
+            lines.append("    t = t._sqr()")
+            if bit == "1":
+                lines.append("    t = t * a")
+        lines.append("    return t")
+        namespace = {}
+        exec("\n".join(lines), namespace)
+        _pow_fixed = namespace["_pow_fixed"]
+
+    _COMPILED_POW[exponent] = _pow_fixed
+    return _pow_fixed
+
 
 # Define the M3System class to hold the parameters and modulus
 # This encapsulates the specific algebraic system (V, *)
@@ -10,6 +313,115 @@ class M3System:
         self.D = D
         self.E = E
         self.modulus = modulus
+        # Parameters bundled as a tuple so the hot arithmetic paths can grab
+        # all of them with a single attribute lookup and one unpack. They are
+        # stored reduced mod N: the formulas only ever use them mod N, and
+        # the int64 compiled paths rely on every operand being below N
+        self._params = (A % modulus, B % modulus, C % modulus, D % modulus,
+                        E % modulus)
+        # Compiled multiply kernel, when numba is available and the modulus
+        # is small enough for the int64 arithmetic inside the kernel
+        if _njit is not None and modulus <= _KERNEL_MAX_MODULUS:
+            self._kernel = _m3_mul_kernel
+            self._sqr_kernel = _m3_sqr_kernel
+        else:
+            self._kernel = None
+            self._sqr_kernel = None
+        # Fast reducer for large special-form moduli, None for plain '%'
+        self._red = _special_form_reducer(modulus)
+        # Whether element components fit array('q') storage
+        self._compact = modulus <= _COMPACT_MAX_MODULUS
+        # Identity element cache, built lazily by identity()
+        self._identity = None
+
+    # The neutral element e = (0, 0, 0) of this system, built once and
+    # shared: __pow__ and user code can reuse it instead of constructing a
+    # fresh zero element each time
+    def identity(self):
+        if self._identity is None:
+            self._identity = M3Element._raw(0, 0, 0, self)
+        return self._identity
+
+
+    # Modular sum of many elements of this system. Each element contributes
+    # one bigint addition on its packed form — all components at once —
+    # instead of per-component adds, reductions and an object per partial
+    # sum; lanes are folded back mod N only when their headroom runs out.
+    # Bulk additive work (averages, linear combinations over the additive
+    # group) is the intended use.
+    def batch_add(self, elements):
+        # Leave this margin: after a fold every lane restarts below N
+        limit = _LANE_MASK // (self.modulus - 1) - 1 if self.modulus > 1 else _LANE_MASK
+        if limit < 2:
+            # Lanes too tight for packed sums; fall back to plain addition
+            result = self.identity()
+            for element in elements:
+                result = result + element
+            return result
+
+        acc = 0
+        count = 0
+        for element in elements:
+            if type(element) is not M3Element or element.system is not self:
+                raise TypeError("Elements must belong to this system.")
+            acc += element._pack()
+            count += 1
+            if count == limit:
+                acc = _reduce_packed(acc, self.modulus, 3)
+                count = 0
+        return M3Element._from_packed(acc, self)
+
+    # Vectorized product of many element pairs at once. a and b are
+    # array-likes of shape (n, 3) holding one vector per row; returns the
+    # (n, 3) array of row-wise products (ab). Orbit sampling and key
+    # derivation over thousands of vectors run this way at C speed instead
+    # of instantiating an M3Element per sample. Requires numpy and, like the
+    # compiled kernels, a modulus small enough for int64 arithmetic.
+    def batch_mul(self, a, b):
+        if self.modulus > _KERNEL_MAX_MODULUS:
+            raise ValueError("Batch operations require modulus <= 2**31.")
+
+        xp = _array_module(a)
+        N = self.modulus
+        A, B, C, D, E = self._params
+        a = xp.asarray(a, dtype=xp.int64) % N
+        b = xp.asarray(b, dtype=xp.int64) % N
+        if a.shape[-1] != 3 or b.shape[-1] != 3:
+            raise ValueError("Arrays must have 3 components along the last axis.")
+
+        a0, a1, a2 = a[..., 0], a[..., 1], a[..., 2]
+        b0, b1, b2 = b[..., 0], b[..., 1], b[..., 2]
+
+        # Same expanded, immediately-reduced products as the int64 kernels;
+        # the component sums stay below 9N, so their reduction can wait
+        r0 = (a0 + b0 + a0 * b0 % N + A * a1 % N * b1 % N
+              + C * a2 % N * b1 % N + B * a2 % N * b2 % N)
+        r1 = (a1 + b1 + a1 * b0 % N + a0 * b1 % N
+              + D * a1 % N * b1 % N + E * a1 % N * b2 % N)
+        r2 = (a2 + b2 + a2 * b0 % N + a0 * b2 % N
+              + D * a2 % N * b1 % N + E * a2 % N * b2 % N)
+        # One vectorized reduction over the stacked result instead of one
+        # '%' dispatch per component
+        return xp.stack([r0, r1, r2], axis=-1) % N
+
+    # Vectorized exponentiation: raises every row of base to the same
+    # exponent, sharing each squaring of the square-and-multiply loop across
+    # the whole batch
+    def batch_pow(self, base, exponent):
+        if not isinstance(exponent, int) or exponent < 0:
+            raise ValueError("Exponent must be a non-negative integer.")
+
+        xp = _array_module(base)
+        base = xp.asarray(base, dtype=xp.int64) % self.modulus
+        if exponent == 0:
+            return xp.zeros_like(base)
+
+        result = base
+        for i in range(exponent.bit_length() - 2, -1, -1):
+            result = self.batch_mul(result, result)
+            if (exponent >> i) & 1:
+                result = self.batch_mul(result, base)
+        return result
 
     # Override __repr__ for better readability of the system object
     def __repr__(self):
@@ -18,35 +430,101 @@ class M3System:
 
 # Define the M3Element class to represent vectors within a specific M3System
 class M3Element:
+    # __slots__ avoids a per-instance __dict__; the system parameters and
+    # modulus are cached into instance slots at construction so the hot
+    # arithmetic paths read them without going through self.system
+    __slots__ = ('system', 'value', '_A', '_B', '_C', '_D', '_E', '_N',
+                 '_kernel', '_sqr_kernel', '_red', '_packed')
+
     def __init__(self, value: list[int], system: M3System):
-        if not isinstance(value, collections.abc.Sequence) or len(value) != 3:
+        # Duck-typed length probe: cheaper than the ABC registry walk of
+        # isinstance(value, Sequence) and accepts any sized iterable, e.g. a
+        # numpy row, without conversion at the call site
+        try:
+            length = len(value)
+        except TypeError:
+            raise ValueError("Value must be a list or tuple of 3 integers.") from None
+        if length != 3:
             raise ValueError("Value must be a list or tuple of 3 integers.")
         if not isinstance(system, M3System):
             raise TypeError("System must be an instance of M3System.")
 
         self.system = system
-        self.value = [x % self.system.modulus for x in value]
+        self._A, self._B, self._C, self._D, self._E = system._params
+        self._N = N = system.modulus
+        self._kernel = system._kernel
+        self._sqr_kernel = system._sqr_kernel
+        self._red = system._red
+        reduced = [x % N for x in value]
+        self.value = _array('q', reduced) if system._compact else reduced
+
+    # Internal fast-path constructor: trusts the caller to pass components
+    # already reduced mod the system modulus, so it skips the validation and
+    # reduction pass of __init__. All arithmetic results are built this way.
+    @classmethod
+    def _raw(cls, v0, v1, v2, system):
+        obj = object.__new__(cls)
+        obj.system = system
+        obj._A, obj._B, obj._C, obj._D, obj._E = system._params
+        obj._N = system.modulus
+        obj._kernel = system._kernel
+        obj._sqr_kernel = system._sqr_kernel
+        obj._red = system._red
+        obj.value = (_array('q', (v0, v1, v2)) if system._compact
+                     else [v0, v1, v2])
+        return obj
+
+    # The components packed into one integer, one 64-bit lane each, cached
+    # lazily on first use (component lists are never mutated in practice)
+    def _pack(self):
+        try:
+            return self._packed
+        except AttributeError:
+            v = self.value
+            p = v[0] | (v[1] << _LANE_BITS) | (v[2] << (2 * _LANE_BITS))
+            self._packed = p
+            return p
+
+    # Rebuild an element from a packed accumulator; the lanes may carry
+    # partial sums, so each is reduced on the way out
+    @classmethod
+    def _from_packed(cls, packed, system):
+        N = system.modulus
+        return cls._raw((packed & _LANE_MASK) % N,
+                        ((packed >> _LANE_BITS) & _LANE_MASK) % N,
+                        ((packed >> (2 * _LANE_BITS)) & _LANE_MASK) % N,
+                        system)
 
     # Standard vector addition for the underlying vector space
     def __add__(self, other):
-        if not isinstance(other, M3Element) or self.system != other.system:
+        if type(other) is not M3Element or self.system is not other.system:
             return NotImplemented # Or raise ValueError for system mismatch
-        return M3Element([(x + y) % self.system.modulus for x, y in zip(self.value, other.value)], self.system)
+        N = self._N
+        a0, a1, a2 = self.value
+        b0, b1, b2 = other.value
+        return M3Element._raw((a0 + b0) % N, (a1 + b1) % N, (a2 + b2) % N,
+                              self.system)
 
     # Standard vector subtraction
     def __sub__(self, other):
-        if not isinstance(other, M3Element) or self.system != other.system:
+        if type(other) is not M3Element or self.system is not other.system:
             return NotImplemented
-        return M3Element([(x - y) % self.system.modulus for x, y in zip(self.value, other.value)], self.system)
+        N = self._N
+        a0, a1, a2 = self.value
+        b0, b1, b2 = other.value
+        return M3Element._raw((a0 - b0) % N, (a1 - b1) % N, (a2 - b2) % N,
+                              self.system)
 
     # Standard unary negation
     def __neg__(self):
-        return M3Element([(-x) % self.system.modulus for x in self.value], self.system)
+        N = self._N
+        a0, a1, a2 = self.value
+        return M3Element._raw((-a0) % N, (-a1) % N, (-a2) % N, self.system)
 
     # The core binary operation '*' as defined in the article
     # Corresponds to (ab) in the article
     def __mul__(self, other):
-        if not isinstance(other, M3Element) or self.system != other.system:
+        if type(other) is not M3Element or self.system is not other.system:
             return NotImplemented # Or raise ValueError for system mismatch
 
         # Components of vector 'a' (self)
@@ -54,56 +532,105 @@ class M3Element:
         # Components of vector 'b' (other)
         b0, b1, b2 = other.value
         
-        # Parameters of the M3System
-        A, B, C, D, E = self.system.A, self.system.B, self.system.C, self.system.D, self.system.E
-        N = self.system.modulus
+        # Parameters of the M3System, rebound from instance slots into locals
+        A = self._A; B = self._B; C = self._C; D = self._D; E = self._E
+        N = self._N
+
+        # Dispatch to the compiled kernel when one is available for this system
+        kernel = self._kernel
+        if kernel is not None:
+            return M3Element._raw(*kernel(a0, a1, a2, b0, b1, b2, A, B, C, D, E, N),
+                                  self.system)
+
+        # Component-wise definition of (ab)_i based on the article's K^3
+        # formula, factored to minimize the number of multiplications.
+        # Components 1 and 2 share the linear form t = b_0 + D b_1 + E b_2:
+        # (ab)_i = a_i + b_i + a_i t + a_0 b_i for i in {1, 2}
+        t = b0 + D * b1 + E * b2
 
-        # Component-wise definition of (ab)_i based on the article's K^3 formula
         # (ab)_0 = a_0 + b_0 + a_0 b_0 + A a_1 b_1 + C a_2 b_1 + B a_2 b_2
-        r0 = (a0 + b0 + a0 * b0 + A * a1 * b1 + C * a2 * b1 + B * a2 * b2) % N
-        
+        r0 = a0 * (1 + b0) + b0 + b1 * (A * a1 + C * a2) + B * a2 * b2
+
         # (ab)_1 = a_1 + b_1 + a_1 b_0 + a_0 b_1 + D a_1 b_1 + E a_1 b_2
-        r1 = (a1 + b1 + a1 * b0 + a0 * b1 + D * a1 * b1 + E * a1 * b2) % N
-        
+        r1 = a1 + b1 + a1 * t + a0 * b1
+
         # (ab)_2 = a_2 + b_2 + a_2 b_0 + a_0 b_2 + D a_2 b_1 + E a_2 b_2
-        r2 = (a2 + b2 + a2 * b0 + a0 * b2 + D * a2 * b1 + E * a2 * b2) % N
+        r2 = a2 + b2 + a2 * t + a0 * b2
 
-        return M3Element([r0, r1, r2], self.system)
+        red = self._red
+        if red is None:
+            return M3Element._raw(r0 % N, r1 % N, r2 % N, self.system)
+        return M3Element._raw(red(r0), red(r1), red(r2), self.system)
+
+    # Specialized squaring (aa): with both operands equal the cross-terms of
+    # '*' coincide, so the shifted components collapse to a_i (2 + a_0 + t)
+    # with t = a_0 + D a_1 + E a_2. Cheaper than self * self; used by __pow__.
+    def _sqr(self):
+        a0, a1, a2 = self.value
+        A = self._A; B = self._B; C = self._C; D = self._D; E = self._E
+        N = self._N
+
+        kernel = self._sqr_kernel
+        if kernel is not None:
+            return M3Element._raw(*kernel(a0, a1, a2, A, B, C, D, E, N),
+                                  self.system)
+
+        # (aa)_0 = a_0 (2 + a_0) + a_1 (A a_1 + C a_2) + B a_2^2
+        r0 = a0 * (2 + a0) + a1 * (A * a1 + C * a2) + B * a2 * a2
+        u = 2 + 2 * a0 + D * a1 + E * a2
+        red = self._red
+        if red is None:
+            return M3Element._raw(r0 % N, a1 * u % N, a2 * u % N, self.system)
+        return M3Element._raw(red(r0), red(a1 * u), red(a2 * u), self.system)
 
     # Implements exponentiation a^n (repeated application of '*')
     # Uses exponentiation by squaring for efficiency
     def __pow__(self, exponent: int):
         if not isinstance(exponent, int) or exponent < 0:
             raise ValueError("Exponent must be a non-negative integer.")
-        
+
         # The neutral element 'e' (multiplicative identity) as defined in the article (0,0,0)
         # a * e = e * a = a
-        identity_element = M3Element([0, 0, 0], self.system) 
-
         if exponent == 0:
-            return identity_element
-
-        # Start with the base vector 'a'
-        base = self 
-        # Initialize result with the identity element
-        result = identity_element
-
-        # Exponentiation by squaring algorithm
-        while exponent > 0:
-            if exponent % 2 == 1: # If the current bit of the exponent is 1
-                result = result * base # Multiply result by the current base power
-            base = base * base       # Square the base
-            exponent //= 2           # Integer division by 2 (shift exponent right)
+            return self.system.identity()
+
+        # The native extension runs the whole square-and-multiply loop in C
+        # for any modulus that fits int64
+        if _ext is not None and self._N <= _EXT_MAX_MODULUS:
+            a0, a1, a2 = self.value
+            r = _ext.m3_pow(a0, a1, a2, self._A, self._B, self._C, self._D,
+                            self._E, self._N, bin(exponent)[2:])
+            return M3Element._raw(r[0], r[1], r[2], self.system)
+
+        # Left-to-right (MSB-first) square-and-multiply: scanning the
+        # exponent bits from the most significant one down costs exactly
+        # bit_length-1 squarings and popcount-1 multiplies, avoiding both
+        # the initial identity multiply and the discarded final squaring of
+        # the LSB-first variant
+        # Long exponents go through windowed exponentiation, which trades a
+        # small precomputed power table for far fewer multiplies
+        if exponent.bit_length() >= _WINDOW_MIN_BITS:
+            return _pow_window(self, exponent)
+
+        # Bind the two hot methods to locals once, outside the loop
+        sqr = M3Element._sqr
+        mul = M3Element.__mul__
+
+        result = self
+        for i in range(exponent.bit_length() - 2, -1, -1):
+            result = sqr(result)
+            if (exponent >> i) & 1:
+                result = mul(result, self)
 
         return result
 
     # String representation for debugging and printing
     def __repr__(self):
-        return f"M3Element(value={self.value}, system_id={id(self.system)})" # Added system_id for clarity
+        return f"M3Element(value={list(self.value)}, system_id={id(self.system)})" # Added system_id for clarity
 
     # User-friendly text representation
     def text(self):
-        return str(self.value)
+        return str(list(self.value))
 
 
 # Define the M4System class to hold the parameters and modulus for the 4D operation
@@ -120,6 +647,113 @@ class M4System:
         self.H = H
         self.I = I
         self.modulus = modulus
+        # Parameters bundled as a tuple so the hot arithmetic paths can grab
+        # all of them with a single attribute lookup and one unpack. They are
+        # stored reduced mod N: the formulas only ever use them mod N, and
+        # the int64 compiled paths rely on every operand being below N
+        self._params = (A % modulus, B % modulus, C % modulus, D % modulus,
+                        E % modulus, F % modulus, G % modulus, H % modulus,
+                        I % modulus)
+        # Compiled multiply kernel, when numba is available and the modulus
+        # is small enough for the int64 arithmetic inside the kernel
+        if _njit is not None and modulus <= _KERNEL_MAX_MODULUS:
+            self._kernel = _m4_mul_kernel
+            self._sqr_kernel = _m4_sqr_kernel
+        else:
+            self._kernel = None
+            self._sqr_kernel = None
+        # Fast reducer for large special-form moduli, None for plain '%'
+        self._red = _special_form_reducer(modulus)
+        # Whether element components fit array('q') storage
+        self._compact = modulus <= _COMPACT_MAX_MODULUS
+        # Identity element cache, built lazily by identity()
+        self._identity = None
+
+    # The neutral element e = (0, 0, 0, 0) of this system, built once and
+    # shared: __pow__ and user code can reuse it instead of constructing a
+    # fresh zero element each time
+    def identity(self):
+        if self._identity is None:
+            self._identity = M4Element._raw(0, 0, 0, 0, self)
+        return self._identity
+
+
+    # Modular sum of many elements of this system. Each element contributes
+    # one bigint addition on its packed form — all components at once —
+    # instead of per-component adds, reductions and an object per partial
+    # sum; lanes are folded back mod N only when their headroom runs out.
+    # Bulk additive work (averages, linear combinations over the additive
+    # group) is the intended use.
+    def batch_add(self, elements):
+        # Leave this margin: after a fold every lane restarts below N
+        limit = _LANE_MASK // (self.modulus - 1) - 1 if self.modulus > 1 else _LANE_MASK
+        if limit < 2:
+            # Lanes too tight for packed sums; fall back to plain addition
+            result = self.identity()
+            for element in elements:
+                result = result + element
+            return result
+
+        acc = 0
+        count = 0
+        for element in elements:
+            if type(element) is not M4Element or element.system is not self:
+                raise TypeError("Elements must belong to this system.")
+            acc += element._pack()
+            count += 1
+            if count == limit:
+                acc = _reduce_packed(acc, self.modulus, 4)
+                count = 0
+        return M4Element._from_packed(acc, self)
+
+    # Vectorized product of many element pairs at once; see
+    # M3System.batch_mul. a and b have shape (n, 4), one vector per row.
+    def batch_mul(self, a, b):
+        if self.modulus > _KERNEL_MAX_MODULUS:
+            raise ValueError("Batch operations require modulus <= 2**31.")
+
+        xp = _array_module(a)
+        N = self.modulus
+        A, B, C, D, E, F, G, H, I = self._params
+        a = xp.asarray(a, dtype=xp.int64) % N
+        b = xp.asarray(b, dtype=xp.int64) % N
+        if a.shape[-1] != 4 or b.shape[-1] != 4:
+            raise ValueError("Arrays must have 4 components along the last axis.")
+
+        a0, a1, a2, a3 = a[..., 0], a[..., 1], a[..., 2], a[..., 3]
+        b0, b1, b2, b3 = b[..., 0], b[..., 1], b[..., 2], b[..., 3]
+
+        # Same expanded, immediately-reduced products as the int64 kernels;
+        # the component sums stay below 10N, so their reduction can wait
+        r0 = (a0 + b0 + a0 * b0 % N + A * a1 % N * b1 % N + E * a3 % N * b1 % N
+              + B * a2 % N * b2 % N + D * a1 % N * b2 % N + F * a3 % N * b2 % N
+              + C * a3 % N * b3 % N)
+        r1 = (a1 + b1 + a1 * b0 % N + a0 * b1 % N + G * a1 % N * b1 % N
+              + H * a1 % N * b2 % N + I * a1 % N * b3 % N)
+        r2 = (a2 + b2 + a2 * b0 % N + a0 * b2 % N + G * a2 % N * b1 % N
+              + H * a2 % N * b2 % N + I * a2 % N * b3 % N)
+        r3 = (a3 + b3 + a3 * b0 % N + a0 * b3 % N + G * a3 % N * b1 % N
+              + H * a3 % N * b2 % N + I * a3 % N * b3 % N)
+        # One vectorized reduction over the stacked result instead of one
+        # '%' dispatch per component
+        return xp.stack([r0, r1, r2, r3], axis=-1) % N
+
+    # Vectorized exponentiation over a batch; see M3System.batch_pow
+    def batch_pow(self, base, exponent):
+        if not isinstance(exponent, int) or exponent < 0:
+            raise ValueError("Exponent must be a non-negative integer.")
+
+        xp = _array_module(base)
+        base = xp.asarray(base, dtype=xp.int64) % self.modulus
+        if exponent == 0:
+            return xp.zeros_like(base)
+
+        result = base
+        for i in range(exponent.bit_length() - 2, -1, -1):
+            result = self.batch_mul(result, result)
+            if (exponent >> i) & 1:
+                result = self.batch_mul(result, base)
+        return result
 
     # Override __repr__ for better readability of the system object
     def __repr__(self):
@@ -128,35 +762,106 @@ class M4System:
 
 # Define the M4Element class to represent vectors within a specific M4System
 class M4Element:
+    # __slots__ avoids a per-instance __dict__; the system parameters and
+    # modulus are cached into instance slots at construction so the hot
+    # arithmetic paths read them without going through self.system
+    __slots__ = ('system', 'value', '_A', '_B', '_C', '_D', '_E', '_F', '_G',
+                 '_H', '_I', '_N', '_kernel', '_sqr_kernel', '_red', '_packed')
+
     def __init__(self, value: list[int], system: M4System):
-        if not isinstance(value, collections.abc.Sequence) or len(value) != 4:
+        # Duck-typed length probe: cheaper than the ABC registry walk of
+        # isinstance(value, Sequence) and accepts any sized iterable, e.g. a
+        # numpy row, without conversion at the call site
+        try:
+            length = len(value)
+        except TypeError:
+            raise ValueError("Value must be a list or tuple of 4 integers.") from None
+        if length != 4:
             raise ValueError("Value must be a list or tuple of 4 integers.")
         if not isinstance(system, M4System):
             raise TypeError("System must be an instance of M4System.")
 
         self.system = system
-        self.value = [x % self.system.modulus for x in value]
+        (self._A, self._B, self._C, self._D, self._E,
+         self._F, self._G, self._H, self._I) = system._params
+        self._N = N = system.modulus
+        self._kernel = system._kernel
+        self._sqr_kernel = system._sqr_kernel
+        self._red = system._red
+        reduced = [x % N for x in value]
+        self.value = _array('q', reduced) if system._compact else reduced
+
+    # Internal fast-path constructor: trusts the caller to pass components
+    # already reduced mod the system modulus, so it skips the validation and
+    # reduction pass of __init__. All arithmetic results are built this way.
+    @classmethod
+    def _raw(cls, v0, v1, v2, v3, system):
+        obj = object.__new__(cls)
+        obj.system = system
+        (obj._A, obj._B, obj._C, obj._D, obj._E,
+         obj._F, obj._G, obj._H, obj._I) = system._params
+        obj._N = system.modulus
+        obj._kernel = system._kernel
+        obj._sqr_kernel = system._sqr_kernel
+        obj._red = system._red
+        obj.value = (_array('q', (v0, v1, v2, v3)) if system._compact
+                     else [v0, v1, v2, v3])
+        return obj
+
+    # The components packed into one integer, one 64-bit lane each, cached
+    # lazily on first use (component lists are never mutated in practice)
+    def _pack(self):
+        try:
+            return self._packed
+        except AttributeError:
+            v = self.value
+            p = (v[0] | (v[1] << _LANE_BITS) | (v[2] << (2 * _LANE_BITS))
+                 | (v[3] << (3 * _LANE_BITS)))
+            self._packed = p
+            return p
+
+    # Rebuild an element from a packed accumulator; the lanes may carry
+    # partial sums, so each is reduced on the way out
+    @classmethod
+    def _from_packed(cls, packed, system):
+        N = system.modulus
+        return cls._raw((packed & _LANE_MASK) % N,
+                        ((packed >> _LANE_BITS) & _LANE_MASK) % N,
+                        ((packed >> (2 * _LANE_BITS)) & _LANE_MASK) % N,
+                        ((packed >> (3 * _LANE_BITS)) & _LANE_MASK) % N,
+                        system)
 
     # Standard vector addition for the underlying vector space
     def __add__(self, other):
-        if not isinstance(other, M4Element) or self.system != other.system:
+        if type(other) is not M4Element or self.system is not other.system:
             return NotImplemented # Or raise ValueError for system mismatch
-        return M4Element([(x + y) % self.system.modulus for x, y in zip(self.value, other.value)], self.system)
+        N = self._N
+        a0, a1, a2, a3 = self.value
+        b0, b1, b2, b3 = other.value
+        return M4Element._raw((a0 + b0) % N, (a1 + b1) % N, (a2 + b2) % N,
+                              (a3 + b3) % N, self.system)
 
     # Standard vector subtraction
     def __sub__(self, other):
-        if not isinstance(other, M4Element) or self.system != other.system:
+        if type(other) is not M4Element or self.system is not other.system:
             return NotImplemented
-        return M4Element([(x - y) % self.system.modulus for x, y in zip(self.value, other.value)], self.system)
+        N = self._N
+        a0, a1, a2, a3 = self.value
+        b0, b1, b2, b3 = other.value
+        return M4Element._raw((a0 - b0) % N, (a1 - b1) % N, (a2 - b2) % N,
+                              (a3 - b3) % N, self.system)
 
     # Standard unary negation
     def __neg__(self):
-        return M4Element([(-x) % self.system.modulus for x in self.value], self.system)
+        N = self._N
+        a0, a1, a2, a3 = self.value
+        return M4Element._raw((-a0) % N, (-a1) % N, (-a2) % N, (-a3) % N,
+                              self.system)
 
     # The core binary operation '*' as defined in the article for K^4
     # Corresponds to (ab) in the article
     def __mul__(self, other):
-        if not isinstance(other, M4Element) or self.system != other.system:
+        if type(other) is not M4Element or self.system is not other.system:
             return NotImplemented # Or raise ValueError for system mismatch
 
         # Components of vector 'a' (self)
@@ -164,59 +869,115 @@ class M4Element:
         # Components of vector 'b' (other)
         b0, b1, b2, b3 = other.value
         
-        # Parameters of the M4System
-        A, B, C, D, E, F, G, H, I = (self.system.A, self.system.B, self.system.C, self.system.D,
-                                      self.system.E, self.system.F, self.system.G, self.system.H, self.system.I)
-        N = self.system.modulus
+        # Parameters of the M4System, rebound from instance slots into locals
+        A = self._A; B = self._B; C = self._C; D = self._D; E = self._E
+        F = self._F; G = self._G; H = self._H; I = self._I
+        N = self._N
+
+        # Dispatch to the compiled kernel when one is available for this system
+        kernel = self._kernel
+        if kernel is not None:
+            return M4Element._raw(*kernel(a0, a1, a2, a3, b0, b1, b2, b3,
+                                          A, B, C, D, E, F, G, H, I, N),
+                                  self.system)
+
+        # Component-wise definition of (ab)_i based on the article's K^4
+        # formula, factored to minimize the number of multiplications.
+        # Components 1-3 share the linear form t = b_0 + G b_1 + H b_2 + I b_3:
+        # (ab)_i = a_i + b_i + a_i t + a_0 b_i for i in {1, 2, 3}
+        t = b0 + G * b1 + H * b2 + I * b3
 
-        # Component-wise definition of (ab)_i based on the article's K^4 formula
         # (ab)_0 = a_0 + b_0 + a_0 b_0 + A a_1 b_1 + E a_3 b_1 + B a_2 b_2 + D a_1 b_2 + F a_3 b_2 + C a_3 b_3
-        r0 = (a0 + b0 + a0 * b0 + A * a1 * b1 + E * a3 * b1 + 
-              B * a2 * b2 + D * a1 * b2 + F * a3 * b2 + C * a3 * b3) % N
-        
+        r0 = (a0 * (1 + b0) + b0 + b1 * (A * a1 + E * a3)
+              + b2 * (B * a2 + D * a1 + F * a3) + C * a3 * b3)
+
         # (ab)_1 = a_1 + b_1 + a_1 b_0 + a_0 b_1 + G a_1 b_1 + H a_1 b_2 + I a_1 b_3
-        r1 = (a1 + b1 + a1 * b0 + a0 * b1 + G * a1 * b1 + H * a1 * b2 + I * a1 * b3) % N
-        
+        r1 = a1 + b1 + a1 * t + a0 * b1
+
         # (ab)_2 = a_2 + b_2 + a_2 b_0 + a_0 b_2 + G a_2 b_1 + H a_2 b_2 + I a_2 b_3
-        r2 = (a2 + b2 + a2 * b0 + a0 * b2 + G * a2 * b1 + H * a2 * b2 + I * a2 * b3) % N
+        r2 = a2 + b2 + a2 * t + a0 * b2
 
         # (ab)_3 = a_3 + b_3 + a_3 b_0 + a_0 b_3 + G a_3 b_1 + H a_3 b_2 + I a_3 b_3
-        r3 = (a3 + b3 + a3 * b0 + a0 * b3 + G * a3 * b1 + H * a3 * b2 + I * a3 * b3) % N
-
-        return M4Element([r0, r1, r2, r3], self.system)
+        r3 = a3 + b3 + a3 * t + a0 * b3
+
+        red = self._red
+        if red is None:
+            return M4Element._raw(r0 % N, r1 % N, r2 % N, r3 % N, self.system)
+        return M4Element._raw(red(r0), red(r1), red(r2), red(r3), self.system)
+
+    # Specialized squaring (aa): with both operands equal the cross-terms of
+    # '*' coincide, so the shifted components collapse to a_i (2 + a_0 + t)
+    # with t = a_0 + G a_1 + H a_2 + I a_3. Cheaper than self * self; used by
+    # __pow__.
+    def _sqr(self):
+        a0, a1, a2, a3 = self.value
+        A = self._A; B = self._B; C = self._C; D = self._D; E = self._E
+        F = self._F; G = self._G; H = self._H; I = self._I
+        N = self._N
+
+        kernel = self._sqr_kernel
+        if kernel is not None:
+            return M4Element._raw(*kernel(a0, a1, a2, a3, A, B, C, D, E, F, G, H, I, N),
+                                  self.system)
+
+        # (aa)_0 = a_0 (2 + a_0) + a_1 (A a_1 + E a_3) + a_2 (B a_2 + D a_1 + F a_3) + C a_3^2
+        r0 = (a0 * (2 + a0) + a1 * (A * a1 + E * a3)
+              + a2 * (B * a2 + D * a1 + F * a3) + C * a3 * a3)
+        u = 2 + 2 * a0 + G * a1 + H * a2 + I * a3
+        red = self._red
+        if red is None:
+            return M4Element._raw(r0 % N, a1 * u % N, a2 * u % N, a3 * u % N,
+                                  self.system)
+        return M4Element._raw(red(r0), red(a1 * u), red(a2 * u), red(a3 * u),
+                              self.system)
 
     # Implements exponentiation a^n (repeated application of '*')
     # Uses exponentiation by squaring for efficiency
     def __pow__(self, exponent: int):
         if not isinstance(exponent, int) or exponent < 0:
             raise ValueError("Exponent must be a non-negative integer.")
-        
+
         # The neutral element 'e' (multiplicative identity) as defined in the article (0,0,0,0)
         # a * e = e * a = a
-        identity_element = M4Element([0, 0, 0, 0], self.system) 
-
         if exponent == 0:
-            return identity_element
-        
-        # Start with the base vector 'a'
-        base = self 
-        # Initialize result with the identity element
-        result = identity_element
-
-        # Exponentiation by squaring algorithm
-        while exponent > 0:
-            if exponent % 2 == 1: # If the current bit of the exponent is 1
-                result = result * base # Multiply result by the current base power
-            base = base * base       # Square the base
-            exponent //= 2           # Integer division by 2 (shift exponent right)
+            return self.system.identity()
+
+        # The native extension runs the whole square-and-multiply loop in C
+        # for any modulus that fits int64
+        if _ext is not None and self._N <= _EXT_MAX_MODULUS:
+            a0, a1, a2, a3 = self.value
+            r = _ext.m4_pow(a0, a1, a2, a3, self._A, self._B, self._C,
+                            self._D, self._E, self._F, self._G, self._H,
+                            self._I, self._N, bin(exponent)[2:])
+            return M4Element._raw(r[0], r[1], r[2], r[3], self.system)
+
+        # Left-to-right (MSB-first) square-and-multiply: scanning the
+        # exponent bits from the most significant one down costs exactly
+        # bit_length-1 squarings and popcount-1 multiplies, avoiding both
+        # the initial identity multiply and the discarded final squaring of
+        # the LSB-first variant
+        # Long exponents go through windowed exponentiation, which trades a
+        # small precomputed power table for far fewer multiplies
+        if exponent.bit_length() >= _WINDOW_MIN_BITS:
+            return _pow_window(self, exponent)
+
+        # Bind the two hot methods to locals once, outside the loop
+        sqr = M4Element._sqr
+        mul = M4Element.__mul__
+
+        result = self
+        for i in range(exponent.bit_length() - 2, -1, -1):
+            result = sqr(result)
+            if (exponent >> i) & 1:
+                result = mul(result, self)
 
         return result
 
     # String representation for debugging and printing
     def __repr__(self):
         # Using id(self.system) to show that elements belong to the same system instance
-        return f"M4Element(value={self.value}, system_id={id(self.system)})" 
+        return f"M4Element(value={list(self.value)}, system_id={id(self.system)})" 
 
     # User-friendly text representation
     def text(self):
-        return str(self.value)
+        return str(list(self.value))
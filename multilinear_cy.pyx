@@ -0,0 +1,299 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# Optional Cython accelerator for multilinear.py.
+#
+# Drop-in replacement for the pure Python module, with element components and
+# system parameters held as C int64 fields: a multiply is 9 C multiplies,
+# 5 adds and a handful of `%` reductions with no boxed intermediates. Build
+# in place with
+#
+#     cythonize -i multilinear_cy.pyx
+#
+# and then `import multilinear_cy as multilinear`. The int64 arithmetic
+# requires modulus <= 2**31 (products of reduced operands must fit a signed
+# 64-bit word); for larger moduli use the pure Python module, which works
+# with arbitrary-precision integers.
+
+from libc.stdint cimport int64_t
+
+# Largest modulus for which the int64 arithmetic below cannot overflow;
+# mirrors _KERNEL_MAX_MODULUS in multilinear.py
+cdef int64_t _MAX_MODULUS = <int64_t>1 << 31
+
+
+# The M3 multiply formula on C scalars; every product is taken between two
+# reduced operands and reduced immediately, so intermediates stay below N**2
+cdef inline void _mul3(int64_t a0, int64_t a1, int64_t a2,
+                       int64_t b0, int64_t b1, int64_t b2,
+                       int64_t A, int64_t B, int64_t C, int64_t D, int64_t E,
+                       int64_t N, int64_t* r) noexcept nogil:
+    r[0] = (a0 + b0 + a0 * b0 % N + A * a1 % N * b1 % N
+            + C * a2 % N * b1 % N + B * a2 % N * b2 % N) % N
+    r[1] = (a1 + b1 + a1 * b0 % N + a0 * b1 % N
+            + D * a1 % N * b1 % N + E * a1 % N * b2 % N) % N
+    r[2] = (a2 + b2 + a2 * b0 % N + a0 * b2 % N
+            + D * a2 % N * b1 % N + E * a2 % N * b2 % N) % N
+
+
+# The M4 multiply formula on C scalars, same reduction discipline
+cdef inline void _mul4(int64_t a0, int64_t a1, int64_t a2, int64_t a3,
+                       int64_t b0, int64_t b1, int64_t b2, int64_t b3,
+                       int64_t A, int64_t B, int64_t C, int64_t D, int64_t E,
+                       int64_t F, int64_t G, int64_t H, int64_t I,
+                       int64_t N, int64_t* r) noexcept nogil:
+    r[0] = (a0 + b0 + a0 * b0 % N + A * a1 % N * b1 % N + E * a3 % N * b1 % N
+            + B * a2 % N * b2 % N + D * a1 % N * b2 % N + F * a3 % N * b2 % N
+            + C * a3 % N * b3 % N) % N
+    r[1] = (a1 + b1 + a1 * b0 % N + a0 * b1 % N + G * a1 % N * b1 % N
+            + H * a1 % N * b2 % N + I * a1 % N * b3 % N) % N
+    r[2] = (a2 + b2 + a2 * b0 % N + a0 * b2 % N + G * a2 % N * b1 % N
+            + H * a2 % N * b2 % N + I * a2 % N * b3 % N) % N
+    r[3] = (a3 + b3 + a3 * b0 % N + a0 * b3 % N + G * a3 % N * b1 % N
+            + H * a3 % N * b2 % N + I * a3 % N * b3 % N) % N
+
+
+# C-field counterpart of multilinear.M3System
+cdef class M3System:
+    cdef readonly int64_t A, B, C, D, E, modulus
+
+    def __init__(self, A, B, C, D, E, modulus):
+        if modulus > _MAX_MODULUS:
+            raise ValueError("Modulus too large for the int64 accelerator; "
+                             "use the pure Python multilinear module.")
+        # Reduce with Python integer semantics before narrowing to int64:
+        # the formulas only use the parameters mod N, and _mul3 needs every
+        # operand below N to keep its products inside a signed 64-bit word
+        self.A = A % modulus
+        self.B = B % modulus
+        self.C = C % modulus
+        self.D = D % modulus
+        self.E = E % modulus
+        self.modulus = modulus
+
+    def __repr__(self):
+        return (f"M3System(A={self.A}, B={self.B}, C={self.C}, D={self.D}, E={self.E}, "
+                f"modulus={self.modulus})")
+
+
+# C-field counterpart of multilinear.M3Element
+cdef class M3Element:
+    cdef readonly M3System system
+    cdef int64_t v0, v1, v2
+
+    def __init__(self, value, system):
+        if len(value) != 3:
+            raise ValueError("Value must be a list or tuple of 3 integers.")
+        if not isinstance(system, M3System):
+            raise TypeError("System must be an instance of M3System.")
+        self.system = system
+        # Reduce with Python integer semantics (handles negatives and
+        # arbitrary-size input) before narrowing to int64
+        self.v0 = value[0] % system.modulus
+        self.v1 = value[1] % system.modulus
+        self.v2 = value[2] % system.modulus
+
+    # Components exposed as a list, matching the pure Python class
+    @property
+    def value(self):
+        return [self.v0, self.v1, self.v2]
+
+    # Fast internal constructor: components already reduced, no validation
+    @staticmethod
+    cdef M3Element _raw(int64_t v0, int64_t v1, int64_t v2, M3System system):
+        cdef M3Element obj = M3Element.__new__(M3Element)
+        obj.system = system
+        obj.v0 = v0
+        obj.v1 = v1
+        obj.v2 = v2
+        return obj
+
+    def __add__(self, other):
+        if not isinstance(other, M3Element) or self.system is not (<M3Element>other).system:
+            return NotImplemented
+        cdef M3Element o = <M3Element>other
+        cdef int64_t N = self.system.modulus
+        return M3Element._raw((self.v0 + o.v0) % N, (self.v1 + o.v1) % N,
+                              (self.v2 + o.v2) % N, self.system)
+
+    def __sub__(self, other):
+        if not isinstance(other, M3Element) or self.system is not (<M3Element>other).system:
+            return NotImplemented
+        cdef M3Element o = <M3Element>other
+        cdef int64_t N = self.system.modulus
+        return M3Element._raw((self.v0 - o.v0 + N) % N, (self.v1 - o.v1 + N) % N,
+                              (self.v2 - o.v2 + N) % N, self.system)
+
+    def __neg__(self):
+        cdef int64_t N = self.system.modulus
+        return M3Element._raw((N - self.v0) % N, (N - self.v1) % N,
+                              (N - self.v2) % N, self.system)
+
+    def __mul__(self, other):
+        if not isinstance(other, M3Element) or self.system is not (<M3Element>other).system:
+            return NotImplemented
+        cdef M3Element o = <M3Element>other
+        cdef M3System s = self.system
+        cdef int64_t r[3]
+        _mul3(self.v0, self.v1, self.v2, o.v0, o.v1, o.v2,
+              s.A, s.B, s.C, s.D, s.E, s.modulus, r)
+        return M3Element._raw(r[0], r[1], r[2], s)
+
+    # Exponentiation by squaring; the whole loop runs on C scalars,
+    # allocating only the final result object
+    def __pow__(self, exponent, modulo):
+        # Three-argument pow() has no meaning here (the operation carries
+        # its own modulus); refuse it like the pure Python class does
+        if modulo is not None:
+            return NotImplemented
+        if not isinstance(exponent, int) or exponent < 0:
+            raise ValueError("Exponent must be a non-negative integer.")
+        cdef M3System s = self.system
+        cdef int64_t N = s.modulus
+        cdef int64_t res[3]
+        cdef int64_t base[3]
+        cdef int64_t tmp[3]
+        res[0] = 0; res[1] = 0; res[2] = 0   # the neutral element (0,0,0)
+        base[0] = self.v0; base[1] = self.v1; base[2] = self.v2
+        while exponent > 0:
+            if exponent & 1:
+                _mul3(res[0], res[1], res[2], base[0], base[1], base[2],
+                      s.A, s.B, s.C, s.D, s.E, N, tmp)
+                res[0] = tmp[0]; res[1] = tmp[1]; res[2] = tmp[2]
+            _mul3(base[0], base[1], base[2], base[0], base[1], base[2],
+                  s.A, s.B, s.C, s.D, s.E, N, tmp)
+            base[0] = tmp[0]; base[1] = tmp[1]; base[2] = tmp[2]
+            exponent >>= 1
+        return M3Element._raw(res[0], res[1], res[2], s)
+
+    def __repr__(self):
+        return f"M3Element(value={self.value}, system_id={id(self.system)})"
+
+    def text(self):
+        return str(self.value)
+
+
+# C-field counterpart of multilinear.M4System
+cdef class M4System:
+    cdef readonly int64_t A, B, C, D, E, F, G, H, I, modulus
+
+    def __init__(self, A, B, C, D, E, F, G, H, I, modulus):
+        if modulus > _MAX_MODULUS:
+            raise ValueError("Modulus too large for the int64 accelerator; "
+                             "use the pure Python multilinear module.")
+        # Reduce with Python integer semantics before narrowing to int64:
+        # the formulas only use the parameters mod N, and _mul4 needs every
+        # operand below N to keep its products inside a signed 64-bit word
+        self.A = A % modulus
+        self.B = B % modulus
+        self.C = C % modulus
+        self.D = D % modulus
+        self.E = E % modulus
+        self.F = F % modulus
+        self.G = G % modulus
+        self.H = H % modulus
+        self.I = I % modulus
+        self.modulus = modulus
+
+    def __repr__(self):
+        return (f"M4System(A={self.A}, B={self.B}, C={self.C}, D={self.D}, E={self.E}, "
+                f"F={self.F}, G={self.G}, H={self.H}, I={self.I}, modulus={self.modulus})")
+
+
+# C-field counterpart of multilinear.M4Element
+cdef class M4Element:
+    cdef readonly M4System system
+    cdef int64_t v0, v1, v2, v3
+
+    def __init__(self, value, system):
+        if len(value) != 4:
+            raise ValueError("Value must be a list or tuple of 4 integers.")
+        if not isinstance(system, M4System):
+            raise TypeError("System must be an instance of M4System.")
+        self.system = system
+        self.v0 = value[0] % system.modulus
+        self.v1 = value[1] % system.modulus
+        self.v2 = value[2] % system.modulus
+        self.v3 = value[3] % system.modulus
+
+    # Components exposed as a list, matching the pure Python class
+    @property
+    def value(self):
+        return [self.v0, self.v1, self.v2, self.v3]
+
+    # Fast internal constructor: components already reduced, no validation
+    @staticmethod
+    cdef M4Element _raw(int64_t v0, int64_t v1, int64_t v2, int64_t v3,
+                        M4System system):
+        cdef M4Element obj = M4Element.__new__(M4Element)
+        obj.system = system
+        obj.v0 = v0
+        obj.v1 = v1
+        obj.v2 = v2
+        obj.v3 = v3
+        return obj
+
+    def __add__(self, other):
+        if not isinstance(other, M4Element) or self.system is not (<M4Element>other).system:
+            return NotImplemented
+        cdef M4Element o = <M4Element>other
+        cdef int64_t N = self.system.modulus
+        return M4Element._raw((self.v0 + o.v0) % N, (self.v1 + o.v1) % N,
+                              (self.v2 + o.v2) % N, (self.v3 + o.v3) % N, self.system)
+
+    def __sub__(self, other):
+        if not isinstance(other, M4Element) or self.system is not (<M4Element>other).system:
+            return NotImplemented
+        cdef M4Element o = <M4Element>other
+        cdef int64_t N = self.system.modulus
+        return M4Element._raw((self.v0 - o.v0 + N) % N, (self.v1 - o.v1 + N) % N,
+                              (self.v2 - o.v2 + N) % N, (self.v3 - o.v3 + N) % N,
+                              self.system)
+
+    def __neg__(self):
+        cdef int64_t N = self.system.modulus
+        return M4Element._raw((N - self.v0) % N, (N - self.v1) % N,
+                              (N - self.v2) % N, (N - self.v3) % N, self.system)
+
+    def __mul__(self, other):
+        if not isinstance(other, M4Element) or self.system is not (<M4Element>other).system:
+            return NotImplemented
+        cdef M4Element o = <M4Element>other
+        cdef M4System s = self.system
+        cdef int64_t r[4]
+        _mul4(self.v0, self.v1, self.v2, self.v3, o.v0, o.v1, o.v2, o.v3,
+              s.A, s.B, s.C, s.D, s.E, s.F, s.G, s.H, s.I, s.modulus, r)
+        return M4Element._raw(r[0], r[1], r[2], r[3], s)
+
+    # Exponentiation by squaring; the whole loop runs on C scalars,
+    # allocating only the final result object
+    def __pow__(self, exponent, modulo):
+        # Three-argument pow() has no meaning here (the operation carries
+        # its own modulus); refuse it like the pure Python class does
+        if modulo is not None:
+            return NotImplemented
+        if not isinstance(exponent, int) or exponent < 0:
+            raise ValueError("Exponent must be a non-negative integer.")
+        cdef M4System s = self.system
+        cdef int64_t N = s.modulus
+        cdef int64_t res[4]
+        cdef int64_t base[4]
+        cdef int64_t tmp[4]
+        res[0] = 0; res[1] = 0; res[2] = 0; res[3] = 0   # the neutral element
+        base[0] = self.v0; base[1] = self.v1; base[2] = self.v2; base[3] = self.v3
+        while exponent > 0:
+            if exponent & 1:
+                _mul4(res[0], res[1], res[2], res[3],
+                      base[0], base[1], base[2], base[3],
+                      s.A, s.B, s.C, s.D, s.E, s.F, s.G, s.H, s.I, N, tmp)
+                res[0] = tmp[0]; res[1] = tmp[1]; res[2] = tmp[2]; res[3] = tmp[3]
+            _mul4(base[0], base[1], base[2], base[3],
+                  base[0], base[1], base[2], base[3],
+                  s.A, s.B, s.C, s.D, s.E, s.F, s.G, s.H, s.I, N, tmp)
+            base[0] = tmp[0]; base[1] = tmp[1]; base[2] = tmp[2]; base[3] = tmp[3]
+            exponent >>= 1
+        return M4Element._raw(res[0], res[1], res[2], res[3], s)
+
+    def __repr__(self):
+        return f"M4Element(value={self.value}, system_id={id(self.system)})"
+
+    def text(self):
+        return str(self.value)